@@ -33,6 +33,7 @@ from cudf._lib.utils import _index_level_name, generate_pandas_metadata
 
 from libc.stdint cimport uint8_t
 from libc.stdlib cimport free
+from libc.string cimport memcpy
 from libcpp cimport bool
 from libcpp.map cimport map
 from libcpp.memory cimport make_unique, unique_ptr
@@ -487,6 +488,49 @@ cdef class ParquetWriter:
         self.initialized = True
 
 
+cdef unique_ptr[vector[uint8_t]] _blob_to_vector(object blob) except *:
+    # Copy a bytes-like metadata blob into a new vector with memcpy,
+    # rather than converting it one Python int at a time
+    cdef const uint8_t[::1] blob_view = memoryview(blob).cast("B")
+    cdef size_t nbytes = blob_view.shape[0]
+    cdef unique_ptr[vector[uint8_t]] blob_c = (
+        make_unique[vector[uint8_t]](nbytes)
+    )
+    if nbytes > 0:
+        memcpy(blob_c.get().data(), &blob_view[0], nbytes)
+    return move(blob_c)
+
+
+cdef class ParquetMetadataMerger:
+    """
+    ParquetMetadataMerger collects the parquet metadata blobs returned
+    by to_parquet one at a time, and merges them into a single blob with
+    one libcudf call. Each appended blob is copied into a C++ buffer
+    right away, so the Python object can be released while other files
+    are still being written. The copies are kept until `merge` is called.
+
+    See Also
+    --------
+    cudf.io.parquet.merge_parquet_filemetadata
+    """
+    cdef vector[unique_ptr[vector[uint8_t]]] blobs
+
+    def append(self, object filemetadata):
+        self.blobs.push_back(move(_blob_to_vector(filemetadata)))
+
+    def __len__(self):
+        return self.blobs.size()
+
+    def merge(self):
+        cdef unique_ptr[vector[uint8_t]] output_c
+
+        with nogil:
+            output_c = move(parquet_merge_metadata(self.blobs))
+
+        out_metadata_py = BufferArrayFromVector.from_unique_ptr(move(output_c))
+        return np.asarray(out_metadata_py)
+
+
 cpdef merge_filemetadata(object filemetadata_list):
     """
     Cython function to call into libcudf API, see `merge_row_group_metadata`.
@@ -495,19 +539,10 @@ cpdef merge_filemetadata(object filemetadata_list):
     --------
     cudf.io.parquet.merge_row_group_metadata
     """
-    cdef vector[unique_ptr[vector[uint8_t]]] list_c
-    cdef vector[uint8_t] blob_c
-    cdef unique_ptr[vector[uint8_t]] output_c
-
+    merger = ParquetMetadataMerger()
     for blob_py in filemetadata_list:
-        blob_c = blob_py
-        list_c.push_back(make_unique[vector[uint8_t]](blob_c))
-
-    with nogil:
-        output_c = move(parquet_merge_metadata(list_c))
-
-    out_metadata_py = BufferArrayFromVector.from_unique_ptr(move(output_c))
-    return np.asarray(out_metadata_py)
+        merger.append(blob_py)
+    return merger.merge()
 
 
 cdef cudf_io_types.statistics_freq _get_stat_freq(object statistics):
@@ -1,37 +1,104 @@
 # Copyright (c) 2019-2020, NVIDIA CORPORATION.
 
+import functools
 import io
 import json
+import operator
+import os
+import re
+import struct
 import warnings
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 
 import fsspec
+import numpy as np
 import pyarrow as pa
 from pyarrow import dataset as ds, parquet as pq
 
 import cudf
 from cudf._lib import parquet as libparquet
-from cudf.api.types import is_list_like
-from cudf.core.column import as_column, build_categorical_column
+from cudf.api.types import is_categorical_dtype, is_list_like
+from cudf.core.column import as_column, build_categorical_column, full
+from cudf.core.index import as_index
 from cudf.utils import ioutils
 
+_OBJECT_STORE_PROTOCOLS = {"s3", "s3a", "gs", "gcs", "abfs", "az"}
+
+# Matches the `key=value` directory segments of a hive-partitioned path
+_HIVE_PARTITION_RE = re.compile(r"(?:^|/)([^/=]+)=([^/]*)(?=/)")
+_HIVE_NULL_VALUE = "__HIVE_DEFAULT_PARTITION__"
+
+# `pq.write_table` options that are also understood by
+# `ds.ParquetFileFormat.make_write_options`
+_DATASET_WRITE_OPTIONS = {
+    "use_dictionary",
+    "version",
+    "write_statistics",
+    "data_page_size",
+    "compression_level",
+    "use_byte_stream_split",
+    "data_page_version",
+    "use_deprecated_int96_timestamps",
+    "coerce_timestamps",
+    "allow_truncated_timestamps",
+}
+
+# Reads the little-endian uint32 footer length of a parquet file
+_unpack_uint32 = struct.Struct("<I").unpack_from
+
+
+def _is_object_store(fs):
+    # Check if `fs` is an object store without real directories
+    protocol = fs.protocol
+    if isinstance(protocol, str):
+        protocol = (protocol,)
+    return any(p in _OBJECT_STORE_PROTOCOLS for p in protocol)
+
 
 def _get_partition_groups(df, partition_cols, preserve_index=False):
-    # TODO: We can use groupby functionality here after cudf#4346.
-    #       Longer term, we want more slicing logic to be pushed down
-    #       into cpp.  For example, it would be best to pass libcudf
-    #       a single sorted table with group offsets).
-    df = df.sort_values(partition_cols)
+    # Use a single libcudf groupby to sort the table and compute
+    # the group offsets on the device. The partition keys of each
+    # group are gathered from the first row of that group.
+    _, offsets, _, grouped_df = df.groupby(
+        partition_cols, dropna=False
+    )._grouped()
     if not preserve_index:
-        df = df.reset_index(drop=True)
-    divisions = df[partition_cols].drop_duplicates(ignore_index=True)
-    splits = df[partition_cols].searchsorted(divisions, side="left")
-    splits = splits.tolist() + [len(df[partition_cols])]
-    return [
-        df.iloc[splits[i] : splits[i + 1]].copy(deep=False)
-        for i in range(0, len(splits) - 1)
-    ]
+        grouped_df.reset_index(drop=True, inplace=True)
+    part_names = grouped_df[partition_cols].iloc[offsets[:-1]]
+    return part_names, grouped_df, offsets
+
+
+def _get_host_partition_keys(part_names):
+    # Copy all partition keys to host in a single transfer, and
+    # return a list with the tuple of keys of every group. Each
+    # value is converted to the scalar `Series.iloc` would return
+    # (a numpy scalar for numeric/temporal data, `cudf.NA` for
+    # nulls), so the directory names keep their original format
+    table = part_names.to_arrow(preserve_index=False)
+    columns = []
+    for name, arrow_col in zip(part_names.columns, table.columns):
+        dtype = part_names[name].dtype
+        if is_categorical_dtype(dtype):
+            dtype = dtype.categories.dtype
+            arrow_col = arrow_col.cast(arrow_col.type.value_type)
+        if dtype.kind in "mM":
+            # Use the integer representation, so that no
+            # precision is lost for nanosecond resolutions
+            unit, _ = np.datetime_data(dtype)
+            values = [
+                None if v is None else dtype.type(v, unit)
+                for v in arrow_col.cast(pa.int64()).to_pylist()
+            ]
+        else:
+            values = arrow_col.to_pylist()
+            if dtype.kind in "biuf":
+                values = [
+                    None if v is None else dtype.type(v) for v in values
+                ]
+        columns.append([cudf.NA if v is None else v for v in values])
+    return list(zip(*columns))
 
 
 # Logic chosen to match: https://arrow.apache.org/
@@ -44,6 +111,7 @@ def write_to_dataset(
     fs=None,
     preserve_index=False,
     return_metadata=False,
+    write_threads=None,
     **kwargs,
 ):
     """Wraps `to_parquet` to write partitioned Parquet datasets.
@@ -78,6 +146,10 @@ def write_to_dataset(
     return_metadata : bool, default False
         Return parquet metadata for written data. Returned metadata will
         include the file-path metadata (relative to `root_path`).
+    write_threads : int, default None
+        Maximum number of partition files to write concurrently. If None,
+        partitions are written one at a time to a local filesystem, and
+        up to 32 at a time to a remote filesystem.
     **kwargs : dict,
         kwargs for to_parquet function.
     """
@@ -92,42 +164,100 @@ def write_to_dataset(
         if len(data_cols) == 0:
             raise ValueError("No data left to save outside partition columns")
 
-        #  Loop through the partition groups
-        for _, sub_df in enumerate(
-            _get_partition_groups(
-                df, partition_cols, preserve_index=preserve_index
-            )
-        ):
-            if sub_df is None or len(sub_df) == 0:
-                continue
-            keys = tuple([sub_df[col].iloc[0] for col in partition_cols])
-            if not isinstance(keys, tuple):
-                keys = (keys,)
-            subdir = fs.sep.join(
-                [
-                    "{colname}={value}".format(colname=name, value=val)
-                    for name, val in zip(partition_cols, keys)
-                ]
+        part_names, grouped_df, part_offsets = _get_partition_groups(
+            df, partition_cols, preserve_index=preserve_index
+        )
+
+        # Copy all partition keys to host in a single transfer
+        part_keys = _get_host_partition_keys(part_names)
+
+        # Build the sub-directory template once, so that each
+        # partition group only needs a single `str.format` call
+        sep = fs.sep
+        subdir_template = sep.join(
+            [
+                str(name).replace("{", "{{").replace("}", "}}") + f"={{{i}}}"
+                for i, name in enumerate(partition_cols)
+            ]
+        )
+
+        # Project away the partition columns once, so that every
+        # partition group is sliced from the data columns directly
+        grouped_df = grouped_df[list(data_cols)]
+
+        # Collect the sub-directory and data of every partition group
+        filename = filename or uuid4().hex + ".parquet"
+        subdirs, sub_dfs = [], []
+        for i, keys in enumerate(part_keys):
+            subdirs.append(subdir_template.format(*keys))
+            sub_dfs.append(
+                grouped_df.iloc[part_offsets[i] : part_offsets[i + 1]]
             )
-            prefix = fs.sep.join([root_path, subdir])
-            fs.mkdirs(prefix, exist_ok=True)
-            filename = filename or uuid4().hex + ".parquet"
-            full_path = fs.sep.join([prefix, filename])
-            write_df = sub_df.copy(deep=False)
-            write_df.drop(columns=partition_cols, inplace=True)
+
+        def _write_one(subdir, sub_df):
+            full_path = f"{root_path}{sep}{subdir}{sep}{filename}"
             with fs.open(full_path, mode="wb") as fil:
                 fil = ioutils.get_IOBase_writer(fil)
                 if return_metadata:
-                    metadata.append(
-                        write_df.to_parquet(
-                            fil,
-                            index=preserve_index,
-                            metadata_file_path=fs.sep.join([subdir, filename]),
-                            **kwargs,
-                        )
+                    return sub_df.to_parquet(
+                        fil,
+                        index=preserve_index,
+                        metadata_file_path=f"{subdir}{sep}{filename}",
+                        **kwargs,
                     )
-                else:
-                    write_df.to_parquet(fil, index=preserve_index, **kwargs)
+                sub_df.to_parquet(fil, index=preserve_index, **kwargs)
+
+        # Write the partitions concurrently when requested (or when
+        # writing to remote storage). The libcudf writer releases the
+        # GIL, so encoding and remote-storage uploads of different
+        # partitions can overlap. Local writes are serial by default,
+        # since callers like dask_cudf already write from many threads
+        if write_threads is None:
+            write_threads = (
+                1
+                if ioutils._is_local_filesystem(fs)
+                else min(32, len(subdirs))
+            )
+        # Create each partition directory once, before any of the
+        # partition files are written. Object stores have no real
+        # directories, so we can skip this step there
+        prefixes = []
+        if not _is_object_store(fs):
+            prefixes = list(
+                dict.fromkeys(f"{root_path}{sep}{sub}" for sub in subdirs)
+            )
+        mkdirs = functools.partial(fs.mkdirs, exist_ok=True)
+
+        def _write_all():
+            # Write every partition and yield the metadata of each
+            # file, in partition order
+            if write_threads <= 1:
+                for prefix in prefixes:
+                    mkdirs(prefix)
+                yield from map(_write_one, subdirs, sub_dfs)
+                return
+            with ThreadPoolExecutor(max_workers=write_threads) as pool:
+                list(pool.map(mkdirs, prefixes))
+                # Limit the number of partitions in flight, so that
+                # the result of each write can be released as soon
+                # as it has been collected
+                pending = deque()
+                for subdir, sub_df in zip(subdirs, sub_dfs):
+                    if len(pending) == 2 * write_threads:
+                        yield pending.popleft().result()
+                    pending.append(pool.submit(_write_one, subdir, sub_df))
+                while pending:
+                    yield pending.popleft().result()
+
+        # Copy each metadata blob into the merger as soon as it
+        # has been collected. The blobs are merged with a single
+        # libcudf call once all partitions have been written
+        merger = libparquet.ParquetMetadataMerger()
+        for md in _write_all():
+            if return_metadata:
+                merger.append(md)
+        if len(merger) > 0:
+            return merger.merge()
 
     else:
         filename = filename or uuid4().hex + ".parquet"
@@ -165,43 +295,113 @@ def read_parquet_metadata(path):
     return num_rows, num_row_groups, col_names
 
 
-def _process_dataset(
-    paths, fs, filters=None, row_groups=None, categorical_partitions=True,
-):
-    # Returns:
-    #     file_list - Expanded/filtered list of paths
-    #     row_groups - Filtered list of row-group selections
-    #     partition_keys - list of partition keys for each file
-    #     partition_categories - Categories for each partition
+# File-info fields that change when a file is rewritten. Local
+# filesystems report `mtime`, while object stores report an ETag
+# and/or a last-modified timestamp
+_FILE_VERSION_FIELDS = (
+    "mtime",
+    "ETag",
+    "etag",
+    "LastModified",
+    "last_modified",
+    "updated",
+)
+
+
+def _get_file_key(path, info):
+    # Identify a file by its path, size and (when available)
+    # modification time or ETag, so that rewriting a file in
+    # place produces a new dataset cache entry
+    return (path, info.get("size")) + tuple(
+        info[field] for field in _FILE_VERSION_FIELDS if field in info
+    )
 
-    # The general purpose of this function is to (1) expand
-    # directory input into a list of paths (using the pyarrow
-    # dataset API), (2) to apply row-group filters, and (3)
-    # to discover directory-partitioning information
 
-    # Deal with case that the user passed in a directory name
-    file_list = paths
-    if len(paths) == 1 and ioutils.is_directory(paths[0]):
-        paths = ioutils.stringify_pathlike(paths[0])
+def _list_dataset_files(fs, root_path):
+    # Recursively list the files under `root_path`, ignoring
+    # any file or directory that starts with "." or "_" (to
+    # match the default pyarrow-dataset discovery behavior).
+    # Returns a sorted tuple of `_get_file_key` entries
+    files = fs.find(root_path, detail=True)
+    return tuple(
+        _get_file_key(path, info)
+        for path, info in sorted(files.items())
+        if not any(
+            part.startswith((".", "_"))
+            for part in path[len(root_path) :].split(fs.sep)
+        )
+    )
 
-    # Convert filters to ds.Expression
-    if filters is not None:
-        filters = pq._filters_to_expression(filters)
+
+def _get_partition_keys(fragment, partition_types):
+    # Parse the hive-partition keys of `fragment` directly from its
+    # path, which is much cheaper than walking the partition
+    # expression with `ds._get_partition_keys`. We fall back to
+    # pyarrow if the path does not contain exactly the expected
+    # partition columns, or if a value needs more than a simple
+    # string/integer conversion
+    raw_keys = dict(_HIVE_PARTITION_RE.findall(fragment.path))
+    if partition_types is not None and (
+        raw_keys.keys() == partition_types.keys()
+    ):
+        keys = {}
+        for name, value in raw_keys.items():
+            typ = partition_types[name]
+            if not value or "%" in value or value == _HIVE_NULL_VALUE:
+                break
+            elif pa.types.is_string(typ):
+                keys[name] = value
+            elif pa.types.is_integer(typ):
+                keys[name] = int(value)
+            else:
+                break
+        else:
+            return keys
+    return ds._get_partition_keys(fragment.partition_expression)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_dataset(
+    file_key,
+    fs,
+    partition_base_dir=None,
+    schema=None,
+    categorical_partitions=True,
+):
+    # Returns a `ds.FileSystemDataset` and the discovered partition
+    # categories for the files in `file_key`. The result is cached,
+    # so that repeated reads of the same dataset do not need to
+    # re-discover the schema and partitioning. `file_key` is a tuple
+    # of `_get_file_key` entries, so that adding, removing or
+    # rewriting a file produces a new cache entry (the fragments of
+    # a cached dataset keep the footer metadata of the old file)
 
     # Initialize ds.FilesystemDataset
     dataset = ds.dataset(
-        paths, filesystem=fs, format="parquet", partitioning="hive",
+        [f[0] for f in file_key],
+        filesystem=fs,
+        format="parquet",
+        partitioning="hive",
+        partition_base_dir=partition_base_dir,
+        schema=schema,
     )
-    file_list = dataset.files
-    if len(file_list) == 0:
-        raise FileNotFoundError(f"{paths} could not be resolved to any files")
 
     # Deal with directory partitioning
     # Get all partition keys (without filters)
+    partition_types = None
     partition_categories = defaultdict(list)
     file_fragment = None
     for file_fragment in dataset.get_fragments():
-        keys = ds._get_partition_keys(file_fragment.partition_expression)
+        if partition_types is None:
+            # Use pyarrow to get the partition columns of the
+            # first fragment, so that the keys of all remaining
+            # fragments can be parsed directly from their paths
+            keys = ds._get_partition_keys(file_fragment.partition_expression)
+            partition_types = {
+                name: dataset.schema.field(name).type for name in keys
+            }
+        else:
+            keys = _get_partition_keys(file_fragment, partition_types)
         if not (keys or partition_categories):
             # Bail - This is not a directory-partitioned dataset
             break
@@ -230,17 +430,76 @@ def _process_dataset(
                 if k in partition_categories
             }
 
+    return dataset, partition_categories, partition_types
+
+
+def _process_dataset(
+    paths,
+    fs,
+    filters=None,
+    row_groups=None,
+    categorical_partitions=True,
+    schema=None,
+):
+    # Returns:
+    #     file_list - Expanded/filtered list of paths
+    #     row_groups - Filtered list of row-group selections
+    #     partition_keys - list of partition keys for each file
+    #     partition_categories - Categories for each partition
+    #     num_rows - Number of rows selected from each file (only
+    #                known when the row-group metadata was already
+    #                parsed to apply `filters`), or None
+    #     index_names - Names of the pandas index columns (taken
+    #                   from the dataset schema metadata)
+
+    # The general purpose of this function is to (1) expand
+    # directory input into a list of paths (using the pyarrow
+    # dataset API), (2) to apply row-group filters, and (3)
+    # to discover directory-partitioning information
+
+    # Deal with case that the user passed in a directory name.
+    # The directory is only listed once, and the listing is
+    # used to look up (or construct) the cached dataset
+    partition_base_dir = None
+    if len(paths) == 1 and ioutils.is_directory(paths[0]):
+        partition_base_dir = ioutils.stringify_pathlike(paths[0])
+        file_key = _list_dataset_files(fs, partition_base_dir)
+    else:
+        # Look up the info of remote files concurrently, since
+        # every lookup is a separate (HEAD) request
+        if ioutils._is_local_filesystem(fs) or len(paths) == 1:
+            infos = list(map(fs.info, paths))
+        else:
+            with ThreadPoolExecutor(max_workers=min(16, len(paths))) as pool:
+                infos = list(pool.map(fs.info, paths))
+        file_key = tuple(map(_get_file_key, paths, infos))
+
+    # Convert filters to ds.Expression
+    if filters is not None:
+        filters = pq._filters_to_expression(filters)
+
+    if len(file_key) == 0:
+        raise FileNotFoundError(f"{paths} could not be resolved to any files")
+    dataset, partition_categories, partition_types = _get_dataset(
+        file_key,
+        fs,
+        partition_base_dir=partition_base_dir,
+        schema=schema,
+        categorical_partitions=categorical_partitions,
+    )
+    file_list = dataset.files
+
     # If we do not have partitioned data and
     # are not filtering, we can return here
     if filters is None and not partition_categories:
-        return file_list, row_groups, [], {}
+        return file_list, row_groups, [], {}, None, []
 
     # Record initial row_groups input
     row_groups_map = {}
     if row_groups is not None:
         # Make sure paths and row_groups map 1:1
         # and save the initial mapping
-        if len(paths) != len(file_list):
+        if partition_base_dir is not None:
             raise ValueError(
                 "Cannot specify a row_group selection for a directory path."
             )
@@ -248,19 +507,21 @@ def _process_dataset(
 
     # Apply filters and discover partition columns
     partition_keys = []
+    num_rows = None
+    range_index = False
     if partition_categories or filters is not None:
         file_list = []
         if filters is not None:
             row_groups = []
+            num_rows = []
+        schema = dataset.schema
         for file_fragment in dataset.get_fragments(filter=filters):
             path = file_fragment.path
 
             # Extract hive-partition keys, and make sure they
             # are orederd the same as they are in `partition_categories`
             if partition_categories:
-                raw_keys = ds._get_partition_keys(
-                    file_fragment.partition_expression
-                )
+                raw_keys = _get_partition_keys(file_fragment, partition_types)
                 partition_keys.append(
                     [
                         (name, raw_keys[name])
@@ -268,34 +529,45 @@ def _process_dataset(
                     ]
                 )
 
-            # Apply row-group filtering
-            selection = row_groups_map.get(path, None)
-            if selection is not None or filters is not None:
-                filtered_row_groups = [
-                    rg_info.id
-                    for rg_fragment in file_fragment.split_by_row_group(
-                        filters, schema=dataset.schema,
-                    )
-                    for rg_info in rg_fragment.row_groups
-                ]
+            # Apply row-group filtering. `subset` evaluates the
+            # filter against the row-group statistics of the
+            # (already parsed) fragment metadata in a single call
             file_list.append(path)
             if filters is not None:
-                if selection is None:
-                    row_groups.append(filtered_row_groups)
-                else:
-                    row_groups.append(
-                        [
-                            rg_id
-                            for rg_id in filtered_row_groups
-                            if rg_id in selection
-                        ]
-                    )
+                filtered_row_groups = file_fragment.subset(
+                    filters, schema=schema
+                ).row_groups
+                selection = row_groups_map.get(path, None)
+                if selection is not None:
+                    selection = set(selection)
+                    filtered_row_groups = [
+                        rg_info
+                        for rg_info in filtered_row_groups
+                        if rg_info.id in selection
+                    ]
+                row_groups.append(
+                    [rg_info.id for rg_info in filtered_row_groups]
+                )
+                num_rows.append(
+                    sum(rg_info.num_rows for rg_info in filtered_row_groups)
+                )
+                # The row counts come for free with the parsed metadata,
+                # but cannot be used if the data has a pandas RangeIndex
+                if len(num_rows) == 1 and _has_range_index(
+                    file_fragment.physical_schema.metadata
+                ):
+                    range_index = True
+
+        if range_index:
+            num_rows = None
 
     return (
         file_list,
         row_groups,
         partition_keys,
         partition_categories if categorical_partitions else {},
+        num_rows,
+        _get_pandas_index_names(dataset.schema.metadata),
     )
 
 
@@ -315,12 +587,12 @@ def _get_byte_ranges(file_list, row_groups, columns, fs, **kwargs):
 
     if row_groups is None:
         if columns is None:
-            return None, None, None  # No reason to construct this
+            return None, None, None, None  # No reason to construct this
         row_groups = [None for path in file_list]
 
-    # Construct a list of required byte-ranges for every file
-    all_byte_ranges, all_footers, all_sizes = [], [], []
-    for path, rgs in zip(file_list, row_groups):
+    footer_sample_size = kwargs.get("footer_sample_size", 32_000)
+
+    def _read_footer(path):
 
         # Step 0 - Get size of file
         if fs is None:
@@ -332,7 +604,7 @@ def _get_byte_ranges(file_list, row_groups, columns, fs, **kwargs):
         #
         # This "sample size" can be tunable, but should
         # always be >= 8 bytes (so we can read the footer size)
-        tail_size = min(kwargs.get("footer_sample_size", 32_000), file_size,)
+        tail_size = min(footer_sample_size, file_size)
         if fs is None:
             path.seek(file_size - tail_size)
             footer_sample = path.read(tail_size)
@@ -341,7 +613,7 @@ def _get_byte_ranges(file_list, row_groups, columns, fs, **kwargs):
 
         # Step 2 - Read the footer size and re-read a larger
         #          tail if necessary
-        footer_size = int.from_bytes(footer_sample[-8:-4], "little")
+        footer_size = _unpack_uint32(footer_sample, len(footer_sample) - 8)[0]
         if tail_size < (footer_size + 8):
             if fs is None:
                 path.seek(file_size - (footer_size + 8))
@@ -349,9 +621,29 @@ def _get_byte_ranges(file_list, row_groups, columns, fs, **kwargs):
             else:
                 footer_sample = fs.tail(path, footer_size + 8)
 
+        return file_size, footer_sample
+
+    # Fetch the footers of all files concurrently, since each
+    # fetch is dominated by remote-storage latency
+    footer_threads = kwargs.get("footer_threads", 16)
+    with ThreadPoolExecutor(
+        max_workers=max(min(footer_threads, len(file_list)), 1)
+    ) as pool:
+        footers_and_sizes = list(pool.map(_read_footer, file_list))
+
+    # Construct a list of required byte-ranges for every file
+    all_byte_ranges, all_footers, all_sizes = [], [], []
+    # Also count the rows that will be read from every file. The
+    # counts are not returned if the data has a pandas RangeIndex
+    all_num_rows = []
+    for (file_size, footer_sample), rgs in zip(footers_and_sizes, row_groups):
+
         # Step 3 - Collect required byte ranges
         byte_ranges = []
+        num_rows = 0
         md = pq.ParquetFile(io.BytesIO(footer_sample)).metadata
+        if all_num_rows is not None and _has_range_index(md.metadata):
+            all_num_rows = None
         column_set = None if columns is None else set(columns)
         if column_set is not None:
             schema = md.schema.to_arrow_schema()
@@ -373,16 +665,17 @@ def _get_byte_ranges(file_list, row_groups, columns, fs, **kwargs):
             # specific row-groups
             if rgs is None or r in rgs:
                 row_group = md.row_group(r)
+                num_rows += row_group.num_rows
                 for c in range(row_group.num_columns):
                     column = row_group.column(c)
                     name = column.path_in_schema
                     # Skip this column if we are targetting a
-                    # specific columns
-                    split_name = name.split(".")[0]
+                    # specific columns. Only split the (nested)
+                    # column name if there is no exact match
                     if (
                         column_set is None
                         or name in column_set
-                        or split_name in column_set
+                        or name.partition(".")[0] in column_set
                     ):
                         file_offset0 = column.dictionary_page_offset
                         if file_offset0 is None:
@@ -393,7 +686,9 @@ def _get_byte_ranges(file_list, row_groups, columns, fs, **kwargs):
         all_byte_ranges.append(byte_ranges)
         all_footers.append(footer_sample)
         all_sizes.append(file_size)
-    return all_byte_ranges, all_footers, all_sizes
+        if all_num_rows is not None:
+            all_num_rows.append(num_rows)
+    return all_byte_ranges, all_footers, all_sizes, all_num_rows
 
 
 @ioutils.doc_read_parquet()
@@ -432,6 +727,8 @@ def read_parquet(
         if not is_list_like(columns):
             raise ValueError("Expected list like for columns")
 
+    dataset_schema = kwargs.pop("dataset_schema", None)
+
     # Start by trying construct a filesystem object, so we
     # can apply filters on remote file-systems
     fs, paths = ioutils._get_filesystem_and_paths(filepath_or_buffer, **kwargs)
@@ -442,22 +739,56 @@ def read_parquet(
     # paths.
     partition_keys = []
     partition_categories = {}
+    num_rows_per_source = None
+    index_names = []
     if fs and paths:
         (
             paths,
             row_groups,
             partition_keys,
             partition_categories,
+            num_rows_per_source,
+            index_names,
         ) = _process_dataset(
             paths,
             fs,
             filters=filters,
             row_groups=row_groups,
             categorical_partitions=categorical_partitions,
+            schema=dataset_schema,
         )
     elif filters is not None:
         raise ValueError("cudf cannot apply filters to open file objects.")
-    filepath_or_buffer = paths if paths else filepath_or_buffer
+    if paths:
+        filepath_or_buffer = paths
+    elif not use_python_file_object:
+        # Binary file objects opened on local files can be read by
+        # libcudf directly from their path. This allows libcudf to
+        # use GPUDirect Storage (when available) instead of first
+        # copying the data into a host buffer. The paths are only
+        # substituted here, so file objects are still never treated
+        # as (hive-partitioned) datasets
+        filepath_or_buffer = [
+            _local_file_path(source) for source in filepath_or_buffer
+        ]
+
+    # Make sure we also read any (non-partition) columns that are
+    # needed to apply the row-wise filters. These extra columns
+    # are dropped again once the filters have been applied. Index
+    # columns are always read when `use_pandas_metadata=True`
+    filter_columns = []
+    if filters is not None and columns is not None and paths:
+        skip_names = set(columns)
+        if partition_keys:
+            skip_names.update(name for name, _ in partition_keys[0])
+        if use_pandas_metadata:
+            skip_names.update(index_names)
+        filter_columns = [
+            name
+            for name in _get_filter_columns(filters)
+            if name not in skip_names
+        ]
+        columns = list(columns) + filter_columns
 
     # Check if we should calculate the specific byte-ranges
     # needed for each parquet file. We always do this when we
@@ -475,9 +806,16 @@ def read_parquet(
                 filepath_or_buffer[0], fsspec.spec.AbstractBufferedFile,
             )
         ):
-            byte_ranges, footers, file_sizes = _get_byte_ranges(
+            (
+                byte_ranges,
+                footers,
+                file_sizes,
+                footer_num_rows,
+            ) = _get_byte_ranges(
                 filepath_or_buffer, row_groups, columns, fs, **kwargs
             )
+            if num_rows_per_source is None:
+                num_rows_per_source = footer_num_rows
 
     filepaths_or_buffers = []
     for i, source in enumerate(filepath_or_buffer):
@@ -513,11 +851,12 @@ def read_parquet(
         if filters is not None:
             warnings.warn(
                 "Parquet row-group filtering is only supported with "
-                "'engine=cudf'. Use pandas or pyarrow API directly "
-                "for full CPU-based filtering functionality."
+                "'engine=cudf'. The filters will only be applied to "
+                "the rows of the (unfiltered) row-groups after they "
+                "are read."
             )
 
-    return _parquet_to_frame(
+    df = _parquet_to_frame(
         filepaths_or_buffers,
         engine,
         *args,
@@ -529,16 +868,109 @@ def read_parquet(
         use_pandas_metadata=use_pandas_metadata,
         partition_keys=partition_keys,
         partition_categories=partition_categories,
+        footers=footers,
+        num_rows_per_source=num_rows_per_source,
         **kwargs,
     )
 
+    # Row-group filtering is not exact, so we apply the
+    # filters to the individual rows of the result
+    if filters:
+        df = _apply_post_filters(df, filters)
+        if filter_columns:
+            df = df.drop(columns=filter_columns)
+    return df
+
+
+def _normalize_filters(filters):
+    # Return `filters` in DNF (a list of conjunctions)
+    if filters and isinstance(filters[0], tuple):
+        return [filters]
+    return filters
+
+
+def _get_pandas_index_names(metadata):
+    # Return the names of the (non-range) index columns in
+    # the pandas entry of the key-value `metadata`
+    if not metadata or b"pandas" not in metadata:
+        return []
+    return [
+        ind
+        for ind in json.loads(metadata[b"pandas"]).get("index_columns", [])
+        if not isinstance(ind, dict)
+    ]
+
+
+def _get_filter_columns(filters):
+    # Return the unique column names used in `filters`
+    return list(
+        dict.fromkeys(
+            name
+            for conjunction in _normalize_filters(filters)
+            for (name, _, _) in conjunction
+        )
+    )
+
+
+_FILTER_OPS = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda col, value: col.isin(value),
+    "not in": lambda col, value: ~col.isin(value),
+}
+
+
+def _apply_post_filters(df, filters):
+    # Apply the DNF `filters` to the rows of `df`. Each predicate
+    # is evaluated with a vectorized libcudf comparison
+
+    def _predicate(name, op, value):
+        if name in df._data:
+            col = df[name]
+        else:
+            # Filters may also reference (named) index columns.
+            # Use the index of `df`, so that the predicates are
+            # aligned when they are combined
+            col = cudf.Series(
+                df.index.get_level_values(name), index=df.index
+            )
+        if is_categorical_dtype(col.dtype):
+            # Compare against the category values, since
+            # (unordered) categoricals only support equality
+            col = col.astype(col.cat.categories.dtype)
+        if op not in _FILTER_OPS:
+            raise ValueError(f"{op} is not a valid filter operator")
+        return _FILTER_OPS[op](col, value).fillna(False)
+
+    mask = functools.reduce(
+        operator.or_,
+        (
+            functools.reduce(
+                operator.and_, (_predicate(*pred) for pred in conjunction)
+            )
+            for conjunction in _normalize_filters(filters)
+        ),
+    )
+    # Assume we can ignore the index if it is an unnamed RangeIndex
+    if isinstance(df.index, cudf.RangeIndex) and df.index.name is None:
+        return df[mask].reset_index(drop=True)
+    return df[mask]
+
 
 def _parquet_to_frame(
     paths_or_buffers,
+    engine,
     *args,
     row_groups=None,
     partition_keys=None,
     partition_categories=None,
+    footers=None,
+    num_rows_per_source=None,
     **kwargs,
 ):
 
@@ -546,38 +978,92 @@ def _parquet_to_frame(
     # one call to `_read_parquet`
     if not partition_keys:
         return _read_parquet(
-            paths_or_buffers, *args, row_groups=row_groups, **kwargs,
+            paths_or_buffers,
+            engine,
+            *args,
+            row_groups=row_groups,
+            footer=footers[0] if footers else None,
+            **kwargs,
         )
 
-    # For partitioned data, we need a distinct read for each
-    # unique set of partition keys. Therefore, we start by
-    # aggregating all paths with matching keys using a dict
-    plan = {}
-    for i, (keys, path) in enumerate(zip(partition_keys, paths_or_buffers)):
-        rgs = row_groups[i] if row_groups else None
-        tkeys = tuple(keys)
-        if tkeys in plan:
-            plan[tkeys][0].append(path)
-            if rgs is not None:
-                plan[tkeys][1].append(rgs)
-        else:
-            plan[tkeys] = ([path], None if rgs is None else [rgs])
+    # Map each partition value to its categorical code
+    category_codes = {
+        name: {value: code for code, value in enumerate(categories)}
+        for name, categories in (partition_categories or {}).items()
+    }
+
+    # Group the sources by their partition keys, using a dict to
+    # preserve the order in which each set of keys first appears.
+    # Both read paths below return the rows in this grouped order
+    plan = defaultdict(list)
+    for i, keys in enumerate(partition_keys):
+        plan[tuple(keys)].append(i)
 
+    def _read_sources(indices):
+        return _read_parquet(
+            [paths_or_buffers[i] for i in indices],
+            engine,
+            *args,
+            row_groups=(
+                [row_groups[i] for i in indices] if row_groups else None
+            ),
+            footer=footers[indices[0]] if footers else None,
+            **kwargs,
+        )
+
+    # If we know how many rows will be read from every file, we
+    # can read all files with a single libcudf call, and then
+    # construct the partition columns for the entire table. This
+    # avoids a separate read for each set of partition keys, and
+    # the peak-memory spike of concatenating the results. The row
+    # counts are only known from metadata that was already parsed
+    # (to apply filters or compute remote byte ranges), since
+    # libcudf will parse every footer again anyway
+    if (
+        num_rows_per_source is not None
+        and engine == "cudf"
+        and kwargs.get("skiprows") is None
+        and kwargs.get("num_rows") is None
+    ):
+        order = [i for indices in plan.values() for i in indices]
+        df = _read_sources(order)
+        counts = as_column([num_rows_per_source[i] for i in order])
+        for k, (name, _) in enumerate(partition_keys[0]):
+            values = [partition_keys[i][k][1] for i in order]
+            if name in category_codes:
+                # Build the categorical column from `codes`
+                codes = as_column(
+                    [category_codes[name][v] for v in values], dtype="int32"
+                )
+                codes = cudf.Series(codes)._repeat(counts)._column
+                df[name] = build_categorical_column(
+                    categories=partition_categories[name],
+                    codes=codes,
+                    size=codes.size,
+                    offset=codes.offset,
+                    ordered=False,
+                )
+            else:
+                # Not building categorical columns, so
+                # `values` are already what we want
+                df[name] = cudf.Series(values)._repeat(counts)._column
+        # Match the index of the concatenated per-key reads below
+        if len(plan) > 1 and df.index.name is None:
+            df = df.reset_index(drop=True)
+        return df
+
+    # Otherwise, we need a distinct read for each
+    # unique set of partition keys
     dfs = []
-    for part_key, (key_paths, key_row_groups) in plan.items():
+    for part_key, indices in plan.items():
         # Add new DataFrame to our list
-        dfs.append(
-            _read_parquet(
-                key_paths, *args, row_groups=key_row_groups, **kwargs,
-            )
-        )
+        dfs.append(_read_sources(indices))
         # Add partition columns to the last DataFrame
         for (name, value) in part_key:
-            if partition_categories and name in partition_categories:
+            if name in category_codes:
                 # Build the categorical column from `codes`
-                codes = as_column(
-                    partition_categories[name].index(value),
-                    length=len(dfs[-1]),
+                codes = full(
+                    len(dfs[-1]), category_codes[name][value], dtype="int32"
                 )
                 dfs[-1][name] = build_categorical_column(
                     categories=partition_categories[name],
@@ -600,6 +1086,40 @@ def _parquet_to_frame(
     )
 
 
+def _local_file_path(source):
+    # Returns the path of `source` if it is an unread binary
+    # file object opened on a local file. Otherwise, `source`
+    # is returned unchanged. The path must be absolute (since
+    # the working directory may have changed since the file was
+    # opened), and must still refer to the open file (which may
+    # have been replaced or removed since)
+    if (
+        isinstance(source, (io.BufferedReader, io.FileIO))
+        and isinstance(source.name, str)
+        and os.path.isabs(source.name)
+        and source.tell() == 0
+    ):
+        try:
+            if os.path.isfile(source.name) and os.path.samestat(
+                os.fstat(source.fileno()), os.stat(source.name)
+            ):
+                return source.name
+        except OSError:
+            pass
+    return source
+
+
+def _has_range_index(metadata):
+    # Check if the key-value `metadata` of a parquet file
+    # describes a pandas RangeIndex
+    if metadata and b"pandas" in metadata:
+        index_columns = json.loads(metadata[b"pandas"]).get(
+            "index_columns", []
+        )
+        return any(isinstance(ind, dict) for ind in index_columns)
+    return False
+
+
 def _read_parquet(
     filepaths_or_buffers,
     engine,
@@ -610,6 +1130,7 @@ def _read_parquet(
     strings_to_categorical=None,
     use_pandas_metadata=None,
     *args,
+    footer=None,
     **kwargs,
 ):
     # Simple helper function to dispatch between
@@ -618,30 +1139,25 @@ def _read_parquet(
         # Temporary error to probe a parquet file
         # and raise decimal128 support error.
         if len(filepaths_or_buffers) > 0:
-            try:
-                metadata = pq.read_metadata(filepaths_or_buffers[0])
-            except TypeError:
-                # pq.read_metadata only supports reading metadata from
-                # certain types of file inputs, like str-filepath or file-like
-                # objects, and errors for the rest of inputs. Hence this is
-                # to avoid failing on other types of file inputs.
-                pass
+            if footer is not None:
+                # Reuse the footer that was already fetched
+                # for the first file in `_get_byte_ranges`
+                metadata = pq.ParquetFile(io.BytesIO(footer)).metadata
             else:
-                arrow_schema = metadata.schema.to_arrow_schema()
-                check_cols = arrow_schema.names if columns is None else columns
-                for col_name, arrow_type in zip(
-                    arrow_schema.names, arrow_schema.types
-                ):
-                    if col_name not in check_cols:
-                        continue
-                    if isinstance(arrow_type, pa.ListType):
-                        val_field_types = arrow_type.value_field.flatten()
-                        for val_field_type in val_field_types:
-                            _check_decimal128_type(val_field_type.type)
-                    elif isinstance(arrow_type, pa.StructType):
-                        _ = cudf.StructDtype.from_arrow(arrow_type)
-                    else:
-                        _check_decimal128_type(arrow_type)
+                try:
+                    metadata = pq.read_metadata(filepaths_or_buffers[0])
+                except TypeError:
+                    # pq.read_metadata only supports reading metadata from
+                    # certain types of file inputs, like str-filepath or
+                    # file-like objects, and errors for the rest of inputs.
+                    # Hence this is to avoid failing on other types of file
+                    # inputs.
+                    metadata = None
+            if metadata is not None:
+                _check_supported_schema(
+                    metadata.schema.to_arrow_schema(),
+                    None if columns is None else tuple(columns),
+                )
 
         return libparquet.read_parquet(
             filepaths_or_buffers,
@@ -733,22 +1249,65 @@ def to_parquet(
 
     else:
 
+        if (
+            partition_cols
+            and index is not False
+            and isinstance(df.index, cudf.RangeIndex)
+        ):
+            # The range-index metadata describes the whole table, but
+            # would be written to every partition file. Store the
+            # index values of each partition instead
+            df = df.copy(deep=False)
+            df.index = as_index(df.index._values, name=df.index.name)
+
         # If index is empty set it to the expected default value of True
         if index is None:
             index = True
 
-        # Convert partition_file_name to a call back
-        if partition_file_name:
-            partition_file_name = lambda x: partition_file_name  # noqa: E731
-
         pa_table = df.to_arrow(preserve_index=index)
-        return pq.write_to_dataset(
+
+        # `ds.write_dataset` requires an "{i}" placeholder in the file
+        # name, and only accepts the writer options that map to file
+        # write options. Use the legacy writer for anything else, so
+        # that every `pq.write_table` argument keeps working
+        if (
+            partition_file_name
+            or args
+            or set(kwargs) - _DATASET_WRITE_OPTIONS - {"filesystem"}
+        ):
+            file_name = partition_file_name
+            return pq.write_to_dataset(
+                pa_table,
+                path,
+                *args,
+                partition_cols=partition_cols,
+                partition_filename_cb=(
+                    (lambda x: file_name) if file_name else None
+                ),
+                compression=compression,
+                **kwargs,
+            )
+
+        # Use the (multi-threaded) C++ dataset writer. A unique
+        # file-name prefix is used so that writing to an existing
+        # dataset adds new files, rather than replacing old ones
+        partitioning = None
+        if partition_cols:
+            partitioning = ds.partitioning(
+                pa.schema([pa_table.schema.field(c) for c in partition_cols]),
+                flavor="hive",
+            )
+        file_format = ds.ParquetFileFormat()
+        return ds.write_dataset(
             pa_table,
-            root_path=path,
-            partition_filename_cb=partition_file_name,
-            partition_cols=partition_cols,
-            *args,
-            **kwargs,
+            base_dir=path,
+            basename_template=uuid4().hex + "-{i}.parquet",
+            format=file_format,
+            partitioning=partitioning,
+            filesystem=kwargs.pop("filesystem", None),
+            file_options=file_format.make_write_options(
+                compression=compression, **kwargs
+            ),
         )
 
 
@@ -762,9 +1321,27 @@ def merge_parquet_filemetadata(filemetadata_list):
 ParquetWriter = libparquet.ParquetWriter
 
 
+@functools.lru_cache(maxsize=128)
+def _check_supported_schema(arrow_schema, columns=None):
+    # Raise if any of the selected columns in `arrow_schema` has a
+    # type that is not supported by the cudf reader. The result is
+    # cached, since all files of a dataset usually share a schema
+    check_cols = arrow_schema.names if columns is None else columns
+    for col_name, arrow_type in zip(arrow_schema.names, arrow_schema.types):
+        if col_name in check_cols:
+            _check_decimal128_type(arrow_type)
+
+
 def _check_decimal128_type(arrow_type):
+    # Walk nested list/struct types, since a decimal128
+    # child is just as unsupported as a top-level one
     if isinstance(arrow_type, pa.Decimal128Type):
         if arrow_type.precision > cudf.Decimal64Dtype.MAX_PRECISION:
             raise NotImplementedError(
                 "Decimal type greater than Decimal64 is not yet supported"
             )
+    elif isinstance(arrow_type, pa.ListType):
+        _check_decimal128_type(arrow_type.value_type)
+    elif isinstance(arrow_type, pa.StructType):
+        for field in arrow_type:
+            _check_decimal128_type(field.type)
@@ -15,7 +15,7 @@ import pyarrow as pa
 import pytest
 from fsspec.core import get_fs_token_paths
 from packaging import version
-from pyarrow import fs as pa_fs, parquet as pq
+from pyarrow import dataset as ds, fs as pa_fs, parquet as pq
 
 import cudf
 from cudf.io.parquet import ParquetWriter, merge_parquet_filemetadata
@@ -26,6 +26,7 @@ from cudf.testing._utils import (
     assert_exceptions_equal,
     random_bitmask,
 )
+from cudf.utils import ioutils
 
 
 @pytest.fixture(scope="module")
@@ -409,6 +410,76 @@ def test_parquet_range_index_pandas_metadata(tmpdir, pandas_compat, as_bytes):
     assert_eq(expect, got)
 
 
+def test_parquet_reader_local_file_object(tmpdir, monkeypatch):
+    df = cudf.DataFrame({"a": range(10), "b": list("abcdefghij")})
+    fname = str(tmpdir.join("local_file_object.parquet"))
+    df.to_parquet(fname)
+
+    # Unread local file objects are read from their path
+    with open(fname, "rb") as f:
+        assert cudf.io.parquet._local_file_path(f) == fname
+        assert_eq(df, cudf.read_parquet(f))
+
+    # Relative paths depend on the current working directory
+    monkeypatch.chdir(str(tmpdir))
+    with open("local_file_object.parquet", "rb") as f:
+        assert cudf.io.parquet._local_file_path(f) is f
+        assert_eq(df, cudf.read_parquet(f))
+
+    # A file that was replaced or removed after it was opened
+    # must be read from the open file object
+    other = str(tmpdir.join("other.parquet"))
+    cudf.DataFrame({"a": [1]}).to_parquet(other)
+    with open(fname, "rb") as f:
+        os.replace(other, fname)
+        assert cudf.io.parquet._local_file_path(f) is f
+        assert_eq(df, cudf.read_parquet(f))
+    df.to_parquet(fname)
+    with open(fname, "rb") as f:
+        os.remove(fname)
+        assert cudf.io.parquet._local_file_path(f) is f
+        assert_eq(df, cudf.read_parquet(f))
+
+
+def test_parquet_reader_local_file_object_partitioned(tmpdir):
+    # File objects are never treated as hive-partitioned datasets,
+    # even if their path contains `key=value` directories
+    df = cudf.DataFrame({"a": range(10)})
+    os.mkdir(str(tmpdir.join("b=1")))
+    fname = str(tmpdir.join("b=1", "part.parquet"))
+    df.to_parquet(fname)
+
+    with open(fname, "rb") as f:
+        assert_eq(df, cudf.read_parquet(f))
+    with open(fname, "rb") as f:
+        with pytest.raises(ValueError):
+            cudf.read_parquet(f, filters=[("a", ">", 5)])
+
+
+@pytest.mark.parametrize(
+    "byte_ranges,max_block,max_gap,expect",
+    [
+        ([], 1000, 50, []),
+        # Unsorted, overlapping and contained ranges
+        (
+            [(100, 10), (0, 10), (5, 20), (200, 5), (202, 1)],
+            1000,
+            50,
+            [(0, 25), (100, 10), (200, 5)],
+        ),
+        # Adjacent ranges are not merged beyond `max_block`
+        ([(20, 10), (0, 10), (10, 10)], 15, 0, [(0, 10), (10, 10), (20, 10)]),
+        # A single range larger than `max_block` is kept whole
+        ([(0, 100), (100, 5)], 10, 0, [(0, 100), (100, 5)]),
+    ],
+)
+def test_parquet_merge_byte_ranges(byte_ranges, max_block, max_gap, expect):
+    got = ioutils._merge_ranges(
+        byte_ranges, max_block=max_block, max_gap=max_gap
+    )
+    assert got == expect
+
+
 def test_parquet_read_metadata(tmpdir, pdf):
     if len(pdf) > 100:
         pytest.skip("Skipping long setup test")
@@ -1663,6 +1734,102 @@ def test_parquet_write_to_dataset(tmpdir_factory, cols):
         gdf.to_parquet(dir1, partition_cols=cols)
 
 
+@pytest.mark.parametrize(
+    "kwargs", [{}, {"use_dictionary": False}, {"row_group_size": 5}]
+)
+@pytest.mark.parametrize("index", [None, True, False])
+def test_parquet_write_to_dataset_pyarrow(tmpdir, kwargs, index):
+    path = str(tmpdir)
+    gdf = cudf.DataFrame({"a": np.arange(20), "b": np.arange(20) % 3})
+    gdf.to_parquet(
+        path, engine="pyarrow", partition_cols=["b"], index=index, **kwargs
+    )
+    assert sorted(os.listdir(path)) == ["b=0", "b=1", "b=2"]
+
+    # Writing again adds new files to the existing dataset
+    gdf.to_parquet(
+        path, engine="pyarrow", partition_cols=["b"], index=index, **kwargs
+    )
+    got = cudf.read_parquet(path)
+    assert len(got.index) == len(got._data["a"])
+    got["b"] = got["b"].astype("int64")
+    expect = cudf.concat([gdf, gdf])
+    assert_eq(
+        expect.sort_values(["a", "b"]).reset_index(drop=True),
+        got.sort_values(["a", "b"]).reset_index(drop=True),
+    )
+
+
+@pytest.mark.parametrize("compression", ["gzip", None])
+def test_parquet_write_to_dataset_pyarrow_compression(tmpdir, compression):
+    # `compression` applies to both the dataset and the legacy writer
+    gdf = cudf.DataFrame({"a": np.arange(20), "b": np.arange(20) % 2})
+    for kwargs in [{}, {"row_group_size": 5}]:
+        path = str(tmpdir.mkdir(f"{len(kwargs)}"))
+        gdf.to_parquet(
+            path,
+            engine="pyarrow",
+            compression=compression,
+            partition_cols=["b"],
+            **kwargs,
+        )
+        for fname in ds.dataset(path, format="parquet").files:
+            md = pq.ParquetFile(fname).metadata
+            got = md.row_group(0).column(0).compression
+            assert got == ("GZIP" if compression else "UNCOMPRESSED")
+
+
+@pytest.mark.parametrize("write_threads", [None, 1, 4])
+def test_parquet_write_to_dataset_threads(tmpdir, write_threads):
+    size = 100
+    gdf = cudf.DataFrame(
+        {
+            "a": np.arange(0, stop=size),
+            "b": np.random.choice(np.arange(10), size=size),
+        }
+    )
+    md = cudf.io.write_to_dataset(
+        gdf,
+        str(tmpdir),
+        partition_cols=["b"],
+        return_metadata=True,
+        write_threads=write_threads,
+    )
+
+    got = cudf.read_parquet(str(tmpdir))
+    got["b"] = got["b"].astype("int64")
+    assert_eq(gdf, got.sort_values("a").reset_index(drop=True))
+
+    # All partition files should be referenced by the metadata
+    md = pq.ParquetFile(BytesIO(md)).metadata
+    assert md.num_rows == size
+    assert md.num_row_groups == gdf["b"].nunique()
+
+
+@pytest.mark.parametrize(
+    "data,expect",
+    [
+        (
+            np.array(
+                ["2020-01-01", "2020-01-02", "2020-01-01"],
+                dtype="datetime64[ns]",
+            ),
+            {
+                "b=2020-01-01T00:00:00.000000000",
+                "b=2020-01-02T00:00:00.000000000",
+            },
+        ),
+        ([1, None, 1], {"b=1", "b=<NA>"}),
+        ([0.5, None, 1.5], {"b=0.5", "b=1.5", "b=<NA>"}),
+        (["x", None, "y"], {"b=x", "b=y", "b=<NA>"}),
+    ],
+)
+def test_parquet_write_to_dataset_partition_names(tmpdir, data, expect):
+    gdf = cudf.DataFrame({"a": [1, 2, 3], "b": data})
+    cudf.io.write_to_dataset(gdf, str(tmpdir), partition_cols=["b"])
+    assert set(os.listdir(str(tmpdir))) == expect
+
+
 @pytest.mark.parametrize(
     "pfilters", [[("b", "==", "b")], [("b", "==", "a"), ("c", "==", 1)]],
 )
@@ -1724,17 +1891,167 @@ def test_read_parquet_partitioned_filtered(
     assert_eq(expect, got)
 
     # Filter on non-partitioned column.
-    # Cannot compare to pandas, since the pyarrow
-    # backend will filter by row (and cudf can
-    # only filter by column, for now)
+    # Row groups are pruned first, and the
+    # remaining rows are filtered afterwards
     filters = [("a", "==", 10)]
     got = cudf.read_parquet(read_path, filters=filters, row_groups=row_groups,)
-    assert len(got) < len(df) and 10 in got["a"]
+    assert len(got) == 1 and 10 in got["a"]
 
     # Filter on both kinds of columns
     filters = [[("a", "==", 10)], [("c", "==", 1)]]
     got = cudf.read_parquet(read_path, filters=filters, row_groups=row_groups,)
     assert len(got) < len(df) and (1 in got["c"] and 10 in got["a"])
+    mask = (got["a"] == 10) | (got["c"].astype("int64") == 1)
+    assert mask.all()
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        [("a", ">", 10)],
+        [("a", "<", 10), ("b", "!=", "c")],
+        [[("a", "in", [1, 50, 99])], [("b", "==", "a")]],
+    ],
+)
+@pytest.mark.parametrize("columns", [None, ["b"]])
+def test_read_parquet_filters_rows(tmpdir, filters, columns):
+    size = 100
+    pdf = pd.DataFrame(
+        {
+            "a": np.arange(0, stop=size, dtype="int64"),
+            "b": np.random.choice(list("abcd"), size=size),
+        }
+    )
+    fname = str(tmpdir.join("filtered.parquet"))
+    pdf.to_parquet(fname, index=False, row_group_size=10)
+
+    expect = pd.read_parquet(fname, filters=filters, columns=columns)
+    got = cudf.read_parquet(fname, filters=filters, columns=columns)
+    assert_eq(expect, got)
+
+
+@pytest.mark.parametrize("columns", [None, ["b"]])
+def test_read_parquet_filters_index(tmpdir, columns):
+    size = 100
+    pdf = pd.DataFrame(
+        {
+            "a": np.arange(0, stop=size, dtype="int64"),
+            "b": np.random.choice(list("abcd"), size=size),
+        },
+        index=pd.Index(np.arange(size, 0, -1), name="idx"),
+    )
+    fname = str(tmpdir.join("filtered_index.parquet"))
+    pdf.to_parquet(fname, row_group_size=10)
+
+    # Filters may reference an index column stored in the pandas
+    # metadata, on their own or combined with column predicates
+    for filters, mask in [
+        ([("idx", ">", 50)], pdf.index > 50),
+        (
+            [("idx", ">", 50), ("a", "<", 70)],
+            (pdf.index > 50) & (pdf["a"] < 70),
+        ),
+        (
+            [[("idx", ">", 50)], [("a", ">", 90)]],
+            (pdf.index > 50) | (pdf["a"] > 90),
+        ),
+    ]:
+        expect = pdf[mask]
+        if columns is not None:
+            expect = expect[columns]
+        got = cudf.read_parquet(fname, filters=filters, columns=columns)
+        assert_eq(expect, got)
+
+
+def test_read_parquet_partitioned_single_read(tmpdir):
+    # Filtered reads of a partitioned dataset use a single libcudf
+    # read, while unfiltered reads use one read per partition key.
+    # Both must return the same rows, in the same order, with the
+    # same index
+    path = str(tmpdir)
+    size = 40
+    for i in range(2):
+        pdf = pd.DataFrame(
+            {
+                "a": np.arange(i * size, (i + 1) * size),
+                "b": np.random.choice(list("xyz"), size=size),
+            },
+            index=np.arange(size)[::-1],
+        )
+        pdf.to_parquet(path, partition_cols=["b"])
+
+    expect = cudf.read_parquet(path)
+    got = cudf.read_parquet(path, filters=[("a", ">=", 0)])
+    assert_eq(expect, got)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["a", "b"],
+        ["1", "2"],
+        ["a%20b", "c"],
+        ["__HIVE_DEFAULT_PARTITION__", "1"],
+        ["", "a"],
+        ["1.5", "2.5"],
+    ],
+)
+@pytest.mark.parametrize("root", ["data", "root=x"])
+def test_parquet_partition_keys_from_path(tmpdir, values, root):
+    # The keys parsed from the fragment paths must match the
+    # keys pyarrow extracts from the partition expressions
+    base = tmpdir.mkdir(root)
+    for i, value in enumerate(values):
+        part_dir = base.mkdir(f"k={value}")
+        cudf.DataFrame({"a": [i]}).to_parquet(str(part_dir.join("0.pq")))
+
+    dataset = ds.dataset(str(base), format="parquet", partitioning="hive")
+    partition_types = {"k": dataset.schema.field("k").type}
+    for fragment in dataset.get_fragments():
+        expect = ds._get_partition_keys(fragment.partition_expression)
+        got = cudf.io.parquet._get_partition_keys(fragment, partition_types)
+        assert got == expect
+
+
+def test_read_parquet_partitioned_cached(tmpdir):
+    # Repeated reads of a directory reuse the cached dataset,
+    # but must still see files added between the reads
+    path = str(tmpdir)
+    df = cudf.DataFrame({"a": np.arange(10), "b": np.arange(10) % 2})
+    df.to_parquet(path, partition_cols=["b"], partition_file_name="0.pq")
+    assert len(cudf.read_parquet(path)) == 10
+    assert len(cudf.read_parquet(path)) == 10
+
+    df.to_parquet(path, partition_cols=["b"], partition_file_name="1.pq")
+    got = cudf.read_parquet(path)
+    assert len(got) == 20
+
+    # Passing a known schema skips schema inference
+    schema = ds.dataset(path, format="parquet", partitioning="hive").schema
+    got = cudf.read_parquet(path, dataset_schema=schema)
+    assert len(got) == 20
+
+
+@pytest.mark.parametrize("selection", ["directory", "files"])
+def test_read_parquet_filtered_rewritten(tmpdir, selection):
+    # Rewriting a file in place must invalidate the cached
+    # dataset, including the row-group metadata of its fragments
+    fname = str(tmpdir.join("part.0.parquet"))
+    path = str(tmpdir) if selection == "directory" else [fname]
+    filters = [("a", ">=", 5)]
+
+    pd.DataFrame({"a": np.arange(10)}).to_parquet(
+        fname, index=False, row_group_size=5
+    )
+    got = cudf.read_parquet(path, filters=filters)
+    assert_eq(got["a"], cudf.Series(np.arange(5, 10), name="a"))
+
+    pd.DataFrame({"a": np.arange(100, 120)}).to_parquet(
+        fname, index=False, row_group_size=4
+    )
+    filters = [("a", ">=", 110)]
+    got = cudf.read_parquet(path, filters=filters)
+    assert_eq(got["a"], cudf.Series(np.arange(110, 120), name="a"))
 
 
 def test_parquet_writer_chunked_metadata(tmpdir, simple_pdf, simple_gdf):
@@ -132,7 +132,8 @@ columns : list, default None
 filters : list of tuple, list of lists of tuples default None
     If not None, specifies a filter predicate used to filter out row groups
     using statistics stored for each row group as Parquet metadata. Row groups
-    that do not match the given filter predicate are not read. The
+    that do not match the given filter predicate are not read, and the
+    remaining rows that do not match the predicate are dropped. The
     predicate is expressed in disjunctive normal form (DNF) like
     `[[('x', '=', 0), ...], ...]`. DNF allows arbitrary boolean logical
     combinations of single column predicates. The innermost tuples each
@@ -164,6 +165,9 @@ use_python_file_object : boolean, default False
     If True, Arrow-backed PythonFile objects will be used in place of fsspec
     AbstractBufferedFile objects at IO time. This option is likely to improve
     performance when making small reads from larger parquet files.
+dataset_schema : pyarrow.Schema, default None
+    If not None, the Arrow schema of the (partitioned or filtered) dataset.
+    Passing a known schema avoids inspecting the dataset files to infer it.
 
 Returns
 -------
@@ -343,7 +347,8 @@ columns : list, default None
 filters : list of tuple, list of lists of tuples default None
     If not None, specifies a filter predicate used to filter out row groups
     using statistics stored for each row group as Parquet metadata. Row groups
-    that do not match the given filter predicate are not read. The
+    that do not match the given filter predicate are not read, and the
+    remaining rows that do not match the predicate are dropped. The
     predicate is expressed in disjunctive normal form (DNF) like
     `[[('x', '=', 0), ...], ...]`. DNF allows arbitrary boolean logical
     combinations of single column predicates. The innermost tuples each
@@ -1601,22 +1606,27 @@ def _fsspec_data_transfer(
 
 
 def _merge_ranges(byte_ranges, max_block=256_000_000, max_gap=64_000):
-    # Simple utility to merge small/adjacent byte ranges
+    # Simple utility to merge small/adjacent byte ranges.
+    # The ranges are sorted first, so that column chunks which
+    # are not listed in file order (or which overlap) are still
+    # coalesced into as few requests as possible
     new_ranges = []
     if not byte_ranges:
         # Early return
         return new_ranges
 
+    byte_ranges = sorted(byte_ranges)
     offset, size = byte_ranges[0]
     for (new_offset, new_size) in byte_ranges[1:]:
         gap = new_offset - (offset + size)
-        if gap > max_gap or (size + new_size + gap) > max_block:
+        end = max(offset + size, new_offset + new_size)
+        if gap > max_gap or (end - offset) > max_block:
             # Gap is too large or total read is too large
             new_ranges.append((offset, size))
             offset = new_offset
             size = new_size
             continue
-        size += new_size + gap
+        size = end - offset
     new_ranges.append((offset, size))
     return new_ranges
 